@@ -11,33 +11,64 @@ Endpoints:
 - GET /health - Health check
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 import os
 import sys
-import json
+import orjson
 import logging
 from datetime import datetime
 import threading
 import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # Add the project root to the path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from jobscanner.db import JobDatabase
-from jobscanner.crawler import JobCrawler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# orjson options shared by every JSON response
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify and request.get_json"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for frontend access
 
 # Initialize database
 db = JobDatabase("jobs.db")
 
+# Long-lived crawl worker process; its shared browser stays warm between crawls
+crawl_executor = None
+
+
+def fast_response(obj, status=200):
+    """Serialize a response body with orjson instead of the stdlib encoder"""
+    return app.response_class(
+        orjson.dumps(obj, option=ORJSON_OPTIONS),
+        status=status,
+        mimetype='application/json'
+    )
+
+
 # Global variables for crawl status
 crawl_status = {
     'is_running': False,
@@ -46,11 +77,43 @@ crawl_status = {
     'error': None
 }
 
+# Cached aggregations, rebuilt after CACHE_TTL seconds or when a crawl adds jobs
+CACHE_TTL = 60
+_cache = {'companies': (None, 0.0), 'stats': (None, 0.0)}
+_cache_lock = threading.Lock()
+_cache_generation = 0  # Bumped by invalidate_cache(); builds from an older generation aren't stored
+
+
+def get_cached(key, build):
+    """Return the cached value for key, rebuilding it with build() once stale"""
+    now = time.time()
+    with _cache_lock:
+        value, ts = _cache[key]
+        if now - ts < CACHE_TTL:
+            return value
+        generation = _cache_generation
+    
+    value = build()
+    with _cache_lock:
+        # An invalidation during the build means the value may predate new jobs
+        if generation == _cache_generation:
+            _cache[key] = (value, now)
+    return value
+
+
+def invalidate_cache():
+    """Force cached aggregations to be rebuilt on the next request"""
+    global _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        for key in _cache:
+            _cache[key] = (None, 0.0)
+
 
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return fast_response({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
         'database': 'connected',
@@ -62,18 +125,43 @@ def health_check():
 def get_stats():
     """Get database statistics"""
     try:
-        stats = db.get_stats()
-        return jsonify({
+        stats = get_cached('stats', db.get_stats)
+        return fast_response({
             'success': True,
             'data': stats,
             'timestamp': datetime.now().isoformat()
         })
     except Exception as e:
         logger.error(f"Error getting stats: {e}")
-        return jsonify({
+        return fast_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
+
+
+def with_metadata(job):
+    """Replace a job row's metadata_json with the parsed metadata dict"""
+    try:
+        job['metadata'] = orjson.loads(job.pop('metadata_json'))
+    except:
+        job['metadata'] = {}
+    return job
+
+
+def stream_jobs(rows, total, limit, offset):
+    """Yield the /api/jobs response body one encoded job at a time"""
+    yield b'{"success":true,"data":{"jobs":['
+    for i, job in enumerate(rows):
+        yield (b',' if i else b'') + orjson.dumps(job)
+    
+    page_info = orjson.dumps({
+        'total': total,
+        'limit': limit,
+        'offset': offset,
+        'has_more': offset + limit < total
+    })
+    timestamp = orjson.dumps(datetime.now().isoformat())
+    yield b'],' + page_info[1:] + b',"timestamp":' + timestamp + b'}'
 
 
 @app.route('/api/jobs')
@@ -86,65 +174,44 @@ def get_jobs():
         limit = request.args.get('limit', type=int, default=50)
         offset = request.args.get('offset', type=int, default=0)
         
-        # Get jobs from database
-        jobs = db.get_jobs(status=status, limit=limit + offset)
-        
-        # Apply additional filters
-        if company:
-            jobs = [job for job in jobs if company.lower() in job['company'].lower()]
-        
-        # Apply pagination
-        paginated_jobs = jobs[offset:offset + limit]
+        # Filter and paginate in SQL, streaming rows out as they are read
+        total = db.count_jobs(status=status, company=company)
+        rows = db.iter_jobs_filtered(
+            status=status, company=company, limit=limit, offset=offset
+        )
         
-        # Parse metadata JSON for each job
-        for job in paginated_jobs:
-            try:
-                job['metadata'] = json.loads(job['metadata_json'])
-                del job['metadata_json']
-            except:
-                job['metadata'] = {}
-        
-        return jsonify({
-            'success': True,
-            'data': {
-                'jobs': paginated_jobs,
-                'total': len(jobs),
-                'limit': limit,
-                'offset': offset,
-                'has_more': offset + limit < len(jobs)
-            },
-            'timestamp': datetime.now().isoformat()
-        })
+        return app.response_class(
+            stream_jobs(rows, total, limit, offset),
+            mimetype='application/json'
+        )
     
     except Exception as e:
         logger.error(f"Error getting jobs: {e}")
-        return jsonify({
+        return fast_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 @app.route('/api/jobs/<int:job_id>')
 def get_job(job_id):
     """Get a specific job by ID"""
     try:
-        jobs = db.get_jobs(limit=None)
-        job = next((j for j in jobs if j['id'] == job_id), None)
+        job = db.get_job(job_id)
         
         if not job:
-            return jsonify({
+            return fast_response({
                 'success': False,
                 'error': 'Job not found'
-            }), 404
+            }, 404)
         
-        # Parse metadata
-        try:
-            job['metadata'] = json.loads(job['metadata_json'])
+        # Full metadata is only parsed on request; source/crawled_at are columns
+        if request.args.get('include_metadata', type=int, default=0):
+            with_metadata(job)
+        else:
             del job['metadata_json']
-        except:
-            job['metadata'] = {}
         
-        return jsonify({
+        return fast_response({
             'success': True,
             'data': job,
             'timestamp': datetime.now().isoformat()
@@ -152,39 +219,20 @@ def get_job(job_id):
     
     except Exception as e:
         logger.error(f"Error getting job {job_id}: {e}")
-        return jsonify({
+        return fast_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 @app.route('/api/companies')
 def get_companies():
     """Get list of companies with job counts"""
     try:
-        jobs = db.get_jobs(limit=None)
-        companies = {}
-        
-        for job in jobs:
-            company = job['company']
-            if company not in companies:
-                companies[company] = {
-                    'name': company,
-                    'job_count': 0,
-                    'latest_posting': None
-                }
-            
-            companies[company]['job_count'] += 1
-            
-            # Track latest posting date
-            if job['posted_date']:
-                if not companies[company]['latest_posting'] or job['posted_date'] > companies[company]['latest_posting']:
-                    companies[company]['latest_posting'] = job['posted_date']
-        
-        # Sort by job count
-        sorted_companies = sorted(companies.values(), key=lambda x: x['job_count'], reverse=True)
+        # Aggregate per company in SQL, sorted by job count
+        sorted_companies = get_cached('companies', db.get_company_stats)
         
-        return jsonify({
+        return fast_response({
             'success': True,
             'data': sorted_companies,
             'total': len(sorted_companies),
@@ -193,10 +241,10 @@ def get_companies():
     
     except Exception as e:
         logger.error(f"Error getting companies: {e}")
-        return jsonify({
+        return fast_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 @app.route('/api/crawl', methods=['POST'])
@@ -205,10 +253,10 @@ def trigger_crawl():
     global crawl_status
     
     if crawl_status['is_running']:
-        return jsonify({
+        return fast_response({
             'success': False,
             'error': 'Crawl already in progress'
-        }), 409
+        }, 409)
     
     try:
         # Parse request data
@@ -222,7 +270,7 @@ def trigger_crawl():
         thread.daemon = True
         thread.start()
         
-        return jsonify({
+        return fast_response({
             'success': True,
             'message': 'Crawl started',
             'search_terms': search_terms,
@@ -231,23 +279,41 @@ def trigger_crawl():
     
     except Exception as e:
         logger.error(f"Error starting crawl: {e}")
-        return jsonify({
+        return fast_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 @app.route('/api/crawl/status')
 def get_crawl_status():
     """Get current crawl status"""
-    return jsonify({
+    return fast_response({
         'success': True,
         'data': crawl_status,
         'timestamp': datetime.now().isoformat()
     })
 
 
-def run_crawl_async(search_terms):
+def submit_crawl(search_terms, locations=None):
+    """Run run_crawl in the crawl worker process and wait for its jobs."""
+    global crawl_executor
+    
+    # Imported on first crawl so serving requests never loads httpx or the browser pool
+    from jobscanner.crawler import run_crawl
+    
+    if crawl_executor is None:
+        crawl_executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+    
+    try:
+        return crawl_executor.submit(run_crawl, search_terms, locations, db.existing_urls()).result()
+    except BrokenProcessPool:
+        # The worker died (e.g. killed for memory); start a new one next time
+        crawl_executor = None
+        raise
+
+
+def run_crawl_async(search_terms, locations=None):
     """Run crawl in background thread"""
     global crawl_status
     
@@ -257,18 +323,15 @@ def run_crawl_async(search_terms):
     try:
         logger.info(f"Starting async crawl with terms: {search_terms}")
         
-        # Initialize crawler
-        crawler = JobCrawler()
+        # Run the crawl in a worker process so the browser and parsing work
+        # stay out of the API process, skipping listings we already have
+        jobs = submit_crawl(search_terms, locations)
         
-        # Run crawl
-        jobs = crawler.crawl_all_sources(search_terms)
+        # Save to database in one transaction
+        new_jobs = db.insert_jobs_bulk(jobs)
         
-        # Save to database
-        new_jobs = 0
-        for job in jobs:
-            job_id = db.insert_job(job)
-            if job_id:
-                new_jobs += 1
+        if new_jobs:
+            invalidate_cache()
         
         # Update status
         crawl_status['last_run'] = datetime.now().isoformat()
@@ -296,39 +359,20 @@ def search_jobs():
         limit = request.args.get('limit', type=int, default=20)
         
         if not query:
-            return jsonify({
+            return fast_response({
                 'success': False,
                 'error': 'Search query is required'
-            }), 400
-        
-        # Get all jobs and filter
-        jobs = db.get_jobs(limit=None)
-        matching_jobs = []
-        
-        query_lower = query.lower()
-        for job in jobs:
-            # Search in title, company, description
-            if (query_lower in job['title'].lower() or 
-                query_lower in job['company'].lower() or 
-                (job['description'] and query_lower in job['description'].lower())):
-                
-                # Parse metadata
-                try:
-                    job['metadata'] = json.loads(job['metadata_json'])
-                    del job['metadata_json']
-                except:
-                    job['metadata'] = {}
-                
-                matching_jobs.append(job)
+            }, 400)
         
-        # Limit results
-        limited_jobs = matching_jobs[:limit]
+        # Indexed (trigram) substring search in SQL
+        limited_jobs = db.search_jobs(query, limit=limit)
+        total = db.count_search_matches(query)
         
-        return jsonify({
+        return fast_response({
             'success': True,
             'data': {
                 'jobs': limited_jobs,
-                'total': len(matching_jobs),
+                'total': total,
                 'query': query,
                 'limit': limit
             },
@@ -337,10 +381,10 @@ def search_jobs():
     
     except Exception as e:
         logger.error(f"Error searching jobs: {e}")
-        return jsonify({
+        return fast_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 if __name__ == '__main__':
@@ -348,14 +392,10 @@ if __name__ == '__main__':
     if len(sys.argv) > 1 and sys.argv[1] == '--initial-crawl':
         logger.info("Running initial crawl...")
         try:
-            crawler = JobCrawler()
-            jobs = crawler.crawl_all_sources(['Staff Engineer', 'VP Engineering'])
+            # Crawl in the worker so its browser is already up for the first API crawl
+            jobs = submit_crawl(['Staff Engineer', 'VP Engineering'])
             
-            new_jobs = 0
-            for job in jobs:
-                job_id = db.insert_job(job)
-                if job_id:
-                    new_jobs += 1
+            new_jobs = db.insert_jobs_bulk(jobs)
             
             logger.info(f"Initial crawl completed: {new_jobs} new jobs")
         except Exception as e:
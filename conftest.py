@@ -0,0 +1,40 @@
+"""
+Pytest configuration for test_api.py, which tests a running JobScanner API.
+
+Options:
+    --api-url URL   API to test (default: http://localhost:5000)
+    --test-crawl    Also trigger a manual crawl and wait for it
+"""
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def pytest_addoption(parser):
+    parser.addoption("--api-url", default="http://localhost:5000", help="JobScanner API to test")
+    parser.addoption("--test-crawl", action="store_true", help="Include the manual crawl test")
+
+
+@pytest.fixture(scope="session")
+def api_url(pytestconfig):
+    """Base URL of the API under test."""
+    return pytestconfig.getoption("--api-url").rstrip("/")
+
+
+@pytest.fixture(scope="session")
+def api_session(api_url):
+    """
+    One requests.Session per test process, so calls reuse keep-alive connections.
+
+    Idempotent GETs retry on connection errors (POST /api/crawl is never
+    retried); an unreachable API fails every test.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=5, pool_maxsize=5, max_retries=Retry(total=2, backoff_factor=0.2))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    yield session
+    session.close()
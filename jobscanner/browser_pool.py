@@ -0,0 +1,99 @@
+# Process-wide Playwright browser shared by every JobCrawler
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Chromium takes seconds to launch, so one browser is started on first use and
+# kept for the life of the process; crawls open cheap contexts in it instead.
+# Async Playwright objects are bound to the loop that created them, so the
+# pool owns that loop too and every crawl in the process runs on it.
+_lock = threading.RLock()  # Held while the loop runs: crawls take turns
+_loop = None
+_playwright = None
+_browser = None
+
+# Chromium and the Playwright driver grow over many crawls in a long-lived
+# worker, so both are relaunched after this many crawls (0 disables recycling)
+RECYCLE_EVERY = int(os.environ.get('JOBSCANNER_BROWSER_RECYCLE_EVERY', '50'))
+_crawls_since_launch = 0
+
+
+def run(coro):
+    """Run a coroutine to completion on the pool's event loop."""
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+        return _loop.run_until_complete(coro)
+
+
+async def get_browser():
+    """Return the shared browser, launching Playwright and Chromium on first use."""
+    global _playwright, _browser
+    if _browser is None or not _browser.is_connected():
+        # Imported on first launch so DB-only callers never load Playwright
+        from playwright.async_api import async_playwright
+        
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+        _browser = await _playwright.chromium.launch(headless=True)
+        logger.info("Launched shared Chromium browser")
+    return _browser
+
+
+async def release_browser():
+    """Count a finished crawl, closing the browser once it has served RECYCLE_EVERY crawls."""
+    global _crawls_since_launch
+    _crawls_since_launch += 1
+    if RECYCLE_EVERY and _crawls_since_launch >= RECYCLE_EVERY:
+        logger.info(f"Recycling shared browser after {_crawls_since_launch} crawls")
+        await _close()
+
+
+async def _close():
+    """Close the browser and Playwright, leaving get_browser() to relaunch them."""
+    global _playwright, _browser, _crawls_since_launch
+    try:
+        if _browser is not None:
+            await _browser.close()
+        if _playwright is not None:
+            await _playwright.stop()
+    except Exception as e:
+        logger.warning(f"Error closing browser: {e}")
+    finally:
+        _browser = None
+        _playwright = None
+        _crawls_since_launch = 0
+
+
+def close_browser():
+    """Shut down the shared browser and Playwright; the next get_browser() relaunches them."""
+    with _lock:
+        if _loop is None:
+            return
+        _loop.run_until_complete(_close())
+
+
+def _shutdown():
+    """Close the browser and its event loop at interpreter exit."""
+    global _loop
+    # A daemon thread may still be crawling on the loop; exit without waiting
+    # for it (the Playwright driver and Chromium go down with the process)
+    if not _lock.acquire(blocking=False):
+        logger.info("Crawl still running at exit; skipping browser cleanup")
+        return
+    try:
+        close_browser()
+        if _loop is not None:
+            _loop.close()
+            _loop = None
+    finally:
+        _lock.release()
+
+
+atexit.register(_shutdown)
@@ -1,19 +1,211 @@
 # Placeholder for job crawler logic
 
-import requests
-from bs4 import BeautifulSoup
-import time
+import asyncio
+from collections import Counter
+from contextlib import asynccontextmanager
+from functools import lru_cache, wraps
+import hashlib
+import os
+import random
+from pathlib import Path
+import httpx
 import re
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse, parse_qs
 import logging
-from playwright.sync_api import sync_playwright
 import json
 
+from jobscanner import browser_pool
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logging.getLogger('httpx').setLevel(logging.WARNING)  # Skip a log line per HTTP request
+
+# Requests the scrapers never need: aborted before they leave the browser
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+BLOCKED_HOSTS_RE = re.compile(r"(doubleclick|googletagmanager|google-analytics|px-cloud|segment\.io)")
+
+# Log-normal pause profiles (mu, sigma, min, max in seconds): most pauses sit
+# near the median with an occasional long one, like a person browsing
+DELAY_PROFILES = {
+    'fast': (0.0, 0.6, 0.3, 3.0),
+    'moderate': (0.7, 0.5, 1.0, 6.0),
+    'careful': (1.2, 0.5, 2.0, 10.0),
+}
+
+# Google jobs mentioning any of these in their location or description are kept
+INTERNATIONAL_KEYWORDS = ('remote', 'international', 'europe', 'israel')
+
+# Runs of 31+ non-space characters: "words" too long to be real (obfuscation)
+LONG_WORD_RE = re.compile(r'\S{31,}')
+
+# Class of each byte for ASCII text: 'a'lpha, 'd'igit, 's'pace or 'o'ther,
+# classified with the same str methods the non-ASCII path uses
+ASCII_CLASSES = bytes(
+    ord('a') if chr(code).isalpha() else
+    ord('d') if chr(code).isdigit() else
+    ord('s') if chr(code).isspace() else
+    ord('o')
+    for code in range(256)
+)
+
+# Google Careers result cards and their fields, in served HTML and in the browser
+GOOGLE_CARD_SELECTOR = '[data-test-id="job-search-result"]'
+GOOGLE_TITLE_SELECTOR = '[data-test-id="job-title"]'
+GOOGLE_LOCATION_SELECTOR = '[data-test-id="job-location"]'
+
+# Read every field of every result card in one browser round-trip
+GOOGLE_CARDS_JS = """
+(cards, args) => cards.map(card => {
+    const text = sel => { const el = card.querySelector(sel); return el ? el.innerText.trim() : ''; };
+    const link = card.querySelector('a');
+    return {
+        title: text(args.title),
+        location: text(args.location),
+        href: link ? link.getAttribute('href') : ''
+    };
+})
+"""
+
+LINKEDIN_CARDS_JS = """
+(cards, args) => cards.slice(0, args.max).map(card => {
+    const texts = sels => sels.map(sel => { const el = card.querySelector(sel); return el ? el.innerText.trim() : ''; });
+    const link = card.querySelector('a[href*="/jobs/view/"]') || card.querySelector('a');
+    const posted = card.querySelector('.job-search-card__listdate');
+    return {
+        titles: texts(args.title),
+        companies: texts(args.company),
+        locations: texts(args.location),
+        href: link ? link.getAttribute('href') : '',
+        posted: posted ? posted.getAttribute('datetime') : null
+    };
+})
+"""
+
+# Browser-like headers for LinkedIn, sent by both the pages and the guest API client
+LINKEDIN_HEADERS = {
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache'
+}
+
+# Server-rendered HTML fragment of search result cards, no JavaScript needed
+LINKEDIN_GUEST_SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+
+# Fallback selectors per card field, tried in order
+LINKEDIN_TITLE_SELECTORS = (
+    '.base-search-card__title',
+    '.base-search-card__title a',
+    '[data-job-title]',
+    '.job-search-card__title'
+)
+
+LINKEDIN_COMPANY_SELECTORS = (
+    '.base-search-card__subtitle',
+    '.base-search-card__subtitle a',
+    '[data-company-name]',
+    '.job-search-card__subtitle'
+)
+
+LINKEDIN_LOCATION_SELECTORS = (
+    '.job-search-card__location',
+    '.base-search-card__location',
+    '[data-job-location]'
+)
+
+
+def _disk_cache(name_template: str):
+    """
+    Cache a crawl method's result as JSON under the crawler's cache_dir.
+    
+    The file name is built from name_template with today's {date} and a
+    {key} derived from the call arguments, so a crawl runs at most once a
+    day per argument set. Caching is off while cache_dir is None, and
+    refresh_cache forces a fresh crawl that overwrites the cached file.
+    Empty results are not cached so a failed crawl is retried.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self.cache_dir:
+                return method(self, *args, **kwargs)
+            
+            call = json.dumps([args, kwargs], sort_keys=True, default=str)
+            key = hashlib.sha1(call.encode()).hexdigest()[:12]
+            path = Path(self.cache_dir) / name_template.format(date=date.today().isoformat(), key=key)
+            
+            if path.exists() and not self.refresh_cache:
+                try:
+                    jobs = json.loads(path.read_text())
+                    logger.info(f"Loaded {len(jobs)} jobs from crawl cache {path}")
+                    return jobs
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable crawl cache {path}: {e}")
+            
+            jobs = method(self, *args, **kwargs)
+            if jobs:
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = path.with_name(path.name + '.tmp')
+                    tmp_path.write_text(json.dumps(jobs))
+                    os.replace(tmp_path, path)
+                except Exception as e:
+                    logger.warning(f"Could not write crawl cache {path}: {e}")
+            return jobs
+        return wrapper
+    return decorator
+
+
+class _PagePool:
+    """
+    A crawl run's browser pages, opened on the first borrow.
+    
+    Searches answered over plain HTTP never borrow a page, so a run that
+    needs no browser fallback never launches Chromium, and a failed launch
+    only fails the searches that needed it.
+    """
+    
+    def __init__(self, open_pages):
+        self._open_pages = open_pages  # Coroutine function: browser -> asyncio.Queue of pages
+        self._pages = None
+        self._opening = asyncio.Lock()
+        self._launch_error = None
+        self.used_browser = False  # Whether this run obtained the shared browser
+    
+    async def get(self):
+        """Take a page, opening the pool (and the shared browser) on first use."""
+        if self._pages is None:
+            async with self._opening:
+                # Launch once per run; later borrowers re-raise the first failure
+                if self._launch_error is not None:
+                    raise self._launch_error
+                if self._pages is None:
+                    try:
+                        browser = await browser_pool.get_browser()
+                        self.used_browser = True
+                        self._pages = await self._open_pages(browser)
+                    except Exception as e:
+                        self._launch_error = e
+                        raise
+        return await self._pages.get()
+    
+    def put_nowait(self, page) -> None:
+        """Return a borrowed page to the pool."""
+        self._pages.put_nowait(page)
+    
+    async def close(self) -> None:
+        """Close every page's context once all scrapers have returned them."""
+        try:
+            while self._pages is not None and not self._pages.empty():
+                await self._pages.get_nowait().context.close()
+        finally:
+            self._pages = None
+            if self.used_browser:
+                await browser_pool.release_browser()
 
 
 class JobCrawler:
@@ -21,11 +213,123 @@ class JobCrawler:
     
     def __init__(self):
         """Initialize the crawler with default settings."""
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
-        self.delay = 2  # Delay between requests in seconds
+        }
+        # Keep-alive pool shared by all plain HTTP fetches in a crawl run
+        self.http_limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        self.delay_profile = os.environ.get('JOBSCANNER_DELAY_PROFILE', 'moderate')  # Key of DELAY_PROFILES
+        self.max_concurrency = 4  # Browser pages scraping in parallel
+        self.max_description_fetches = 16  # Parallel HTTP fetches of job detail pages
+        self.known_urls = set()  # URLs already stored; matching listings are skipped
+        self.cache_dir = None  # Directory for the daily crawl_all_sources cache; None disables it
+        self.refresh_cache = False  # Crawl even when today's cache file exists
+        
+        # Stamped once per crawl run by _run() and shared by every job it finds
+        self._crawl_date = None
+        self._crawl_ts = None
+        
+        # Started lazily and shared by every crawl until close(); the browser
+        # and event loop belong to browser_pool and outlive the crawler
+        self._http = None
+        self._http_slots = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Shut down the crawler's HTTP client; the shared browser stays up for later crawls."""
+        if self._http is None:
+            return
+        try:
+            browser_pool.run(self._http.aclose())
+        except Exception as e:
+            logger.warning(f"Error closing HTTP client: {e}")
+        finally:
+            self._http = None
+            self._http_slots = None
+    
+    def _run(self, coro):
+        """Run a coroutine on the browser pool's event loop, which outlives each crawl."""
+        now = datetime.now()
+        self._crawl_date = now.date().isoformat()
+        self._crawl_ts = now.isoformat()
+        return browser_pool.run(coro)
+    
+    async def _ensure_http(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP/2 client on first use; it lives until close()."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                headers=self.headers,
+                timeout=10.0,
+                limits=self.http_limits,
+                follow_redirects=True
+            )
+            # Bounds concurrent guest API searches like the page pool bounds browser searches
+            self._http_slots = asyncio.Semaphore(self.max_concurrency)
+        return self._http
+    
+    async def _open_pages(self, browser) -> asyncio.Queue:
+        """Open max_concurrency independent browser pages, one page each, for scrapers to borrow."""
+        pages = asyncio.Queue()
+        for _ in range(self.max_concurrency):
+            context = await browser.new_context()
+            await context.route("**/*", self._route_request)
+            pages.put_nowait(await context.new_page())
+        return pages
+    
+    async def _route_request(self, route) -> None:
+        """Abort images, styles, fonts, media and trackers; job cards only need documents and scripts."""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_HOSTS_RE.search(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    @asynccontextmanager
+    async def _borrow_page(self, pages: _PagePool):
+        """
+        Borrow a page from the pool; each search navigates it with goto.
+        
+        Pages are reused across searches, so their context's connections and
+        cookies stay warm. A page that was closed is replaced by a new one in
+        the same context, and per-search extra headers are cleared on return.
+        """
+        page = await pages.get()
+        try:
+            if page.is_closed():
+                page = await page.context.new_page()
+            yield page
+        finally:
+            try:
+                if not page.is_closed():
+                    await page.set_extra_http_headers({})
+            except Exception as e:
+                logger.debug(f"Could not reset page headers: {e}")
+            pages.put_nowait(page)
+    
+    async def _run_with_browser(self, crawl, *args) -> List[Dict]:
+        """Run an async scraper on a page pool of the shared browser, opened only if a search needs it."""
+        pages = _PagePool(self._open_pages)
+        try:
+            return await crawl(pages, *args)
+        finally:
+            await pages.close()
+    
+    @staticmethod
+    def _flatten_results(results: list, source: str) -> List[Dict]:
+        """Join per-search job lists from asyncio.gather, logging failed searches."""
+        jobs = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error crawling {source}: {result}")
+            else:
+                jobs.extend(result)
+        return jobs
     
     def crawl_google_careers(self, search_terms: List[str] = None, max_pages: int = 3) -> List[Dict]:
         """
@@ -38,77 +342,189 @@ class JobCrawler:
         Returns:
             List of job dictionaries
         """
-        jobs = []
-        
+        try:
+            return self._run(self._run_with_browser(self.crawl_google_careers_async, search_terms, max_pages))
+        except Exception as e:
+            logger.error(f"Error crawling Google Careers: {e}")
+            return []
+    
+    async def crawl_google_careers_async(self, pages: _PagePool, search_terms: List[str] = None,
+                                         max_pages: int = 3) -> List[Dict]:
+        """Crawl Google Careers, scraping search terms concurrently across the page pool."""
         if not search_terms:
             search_terms = ['VP Engineering', 'Director Engineering', 'Engineering Manager', 'Staff Engineer']
         
         logger.info(f"Crawling Google Careers for terms: {search_terms}")
         
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                
-                for term in search_terms:
-                    logger.info(f"Searching for: {term}")
-                    
-                    # Navigate to Google Careers with search
-                    search_url = f"https://careers.google.com/jobs/results/?q={term.replace(' ', '%20')}"
-                    page.goto(search_url)
-                    
-                    # Wait for jobs to load
-                    page.wait_for_selector('[data-test-id="job-search-result"]', timeout=10000)
-                    
-                    # Scroll to load more jobs
-                    for i in range(max_pages):
-                        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                        time.sleep(2)
-                    
-                    # Extract job listings
-                    job_elements = page.query_selector_all('[data-test-id="job-search-result"]')
-                    
-                    for job_elem in job_elements:
-                        try:
-                            job_data = self._extract_google_job(page, job_elem)
-                            if job_data:
-                                jobs.append(job_data)
-                        except Exception as e:
-                            logger.error(f"Error extracting Google job: {e}")
-                            continue
-                    
-                    time.sleep(self.delay)
-                
-                browser.close()
+        results = await asyncio.gather(*[
+            self._scrape_google_term(pages, term, max_pages)
+            for term in search_terms
+        ], return_exceptions=True)
+        jobs = self._flatten_results(results, 'Google Careers')
         
-        except Exception as e:
-            logger.error(f"Error crawling Google Careers: {e}")
+        await self._fetch_google_descriptions(jobs)
         
         logger.info(f"Found {len(jobs)} jobs from Google Careers")
         return jobs
     
-    def _extract_google_job(self, page, job_elem) -> Optional[Dict]:
-        """Extract job data from a Google Careers job element."""
-        try:
-            # Extract basic info
-            title_elem = job_elem.query_selector('[data-test-id="job-title"]')
-            title = title_elem.inner_text().strip() if title_elem else ""
-            
-            location_elem = job_elem.query_selector('[data-test-id="job-location"]')
-            location = location_elem.inner_text().strip() if location_elem else ""
-            
-            # Get job URL by clicking and extracting from current URL
-            job_elem.click()
-            time.sleep(1)
-            url = page.url
+    async def _scrape_google_term(self, pages: _PagePool, term: str, max_pages: int) -> List[Dict]:
+        """Scrape the Google Careers results for a single search term."""
+        logger.info(f"Searching for: {term}")
+        search_url = f"https://careers.google.com/jobs/results/?q={term.replace(' ', '%20')}"
+        
+        # Server-rendered HTML first; only drive a browser page if it has no result cards
+        result = await self._fetch_google_static_cards(search_url)
+        if result is None:
+            result = await self._scrape_google_cards(pages, search_url, max_pages)
+        cards, page_url = result
+        
+        jobs = []
+        for card in cards:
+            try:
+                job_data = self._extract_google_job(card, page_url)
+                if job_data:
+                    jobs.append(job_data)
+            except Exception as e:
+                logger.error(f"Error extracting Google job: {e}")
+                continue
+        
+        return jobs
+    
+    async def _fetch_static(self, url: str) -> Optional[httpx.Response]:
+        """GET a page over the pooled HTTP client; None unless it answered 200."""
+        client = await self._ensure_http()
+        async with self._http_slots:
+            try:
+                response = await client.get(url)
+            except httpx.HTTPError as e:
+                logger.warning(f"Static fetch failed for {url}: {e}")
+                return None
+            finally:
+                await asyncio.sleep(self._human_delay())
+        
+        if response.status_code != 200:
+            logger.warning(f"Static fetch returned {response.status_code} for {url}")
+            return None
+        return response
+    
+    async def _fetch_google_static_cards(self, search_url: str) -> Optional[Tuple[List[Dict], str]]:
+        """
+        Read Google Careers result cards from the search page's HTML without a browser.
+        
+        Returns:
+            Card dictionaries shaped like GOOGLE_CARDS_JS output and the final
+            page URL, or None if the fetch failed or the cards are rendered
+            client-side and the caller should use Playwright
+        """
+        response = await self._fetch_static(search_url)
+        if response is None:
+            return None
+        
+        from bs4 import BeautifulSoup
+        
+        soup = BeautifulSoup(response.text, 'html.parser')
+        cards = soup.select(GOOGLE_CARD_SELECTOR)
+        if not cards:
+            return None
+        return [self._parse_google_card(card) for card in cards], str(response.url)
+    
+    def _parse_google_card(self, card) -> Dict:
+        """Read a BeautifulSoup result card into the same shape GOOGLE_CARDS_JS returns."""
+        title, location = self._select_texts(card, (GOOGLE_TITLE_SELECTOR, GOOGLE_LOCATION_SELECTOR))
+        link = card.select_one('a')
+        return {
+            'title': title,
+            'location': location,
+            'href': link.get('href', "") if link else ""
+        }
+    
+    async def _scrape_google_cards(self, pages: _PagePool, search_url: str,
+                                   max_pages: int) -> Tuple[List[Dict], str]:
+        """Load a Google Careers search page in the browser and read its result cards."""
+        cards = []
+        page_url = search_url
+        
+        async with self._borrow_page(pages) as page:
+            try:
+                await page.goto(search_url)
+                page_url = page.url
+                
+                # Wait for jobs to load
+                await page.wait_for_selector(GOOGLE_CARD_SELECTOR, timeout=10000)
+                
+                # Scroll to load more jobs
+                await self._scroll_for_more(page, GOOGLE_CARD_SELECTOR, max_pages)
+                
+                # Extract job listings
+                cards = await page.eval_on_selector_all(GOOGLE_CARD_SELECTOR, GOOGLE_CARDS_JS, {
+                    'title': GOOGLE_TITLE_SELECTOR,
+                    'location': GOOGLE_LOCATION_SELECTOR
+                })
+                
+                await asyncio.sleep(self._human_delay())
             
-            # Extract description from the detail page
-            desc_elem = page.query_selector('[data-test-id="job-description"]')
-            description = desc_elem.inner_text().strip() if desc_elem else ""
+            except Exception as e:
+                logger.error(f"Error crawling Google Careers at {search_url}: {e}")
+        
+        return cards, page_url
+    
+    async def _scroll_for_more(self, page, selector: str, rounds: int) -> None:
+        """
+        Scroll to the bottom up to `rounds` times, waiting only until new cards render.
+        
+        Stops early once a scroll brings in no new cards within the timeout,
+        instead of sleeping a fixed time after every scroll.
+        """
+        count = await page.eval_on_selector_all(selector, "cards => cards.length")
+        for _ in range(rounds):
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            try:
+                await page.wait_for_function(
+                    "([selector, count]) => document.querySelectorAll(selector).length > count",
+                    arg=[selector, count],
+                    timeout=4000
+                )
+            except Exception:
+                # Timed out: the list is exhausted or not paginated by scrolling
+                break
+            count = await page.eval_on_selector_all(selector, "cards => cards.length")
+    
+    async def _fetch_google_descriptions(self, jobs: List[Dict]) -> None:
+        """Fetch job descriptions in parallel over one pooled HTTP client, without page navigation."""
+        from bs4 import BeautifulSoup
+        
+        semaphore = asyncio.Semaphore(self.max_description_fetches)
+        
+        async def fetch(client, job):
+            if not job['url']:
+                return
+            async with semaphore:
+                try:
+                    response = await client.get(job['url'])
+                    if response.status_code != 200:
+                        return
+                    soup = BeautifulSoup(response.text, 'html.parser')
+                    desc_elem = soup.select_one('[data-test-id="job-description"]')
+                    if desc_elem:
+                        job['description'] = self._clean_text(desc_elem.get_text(' '))
+                        job['metadata'].pop('description_pending', None)
+                except Exception as e:
+                    logger.debug(f"Could not fetch description for {job['url']}: {e}")
+        
+        client = await self._ensure_http()
+        await asyncio.gather(*[fetch(client, job) for job in jobs])
+    
+    def _extract_google_job(self, card: Dict, page_url: str) -> Optional[Dict]:
+        """Build job data from the fields read off a Google Careers result card."""
+        try:
+            title = card['title']
+            location = card['location']
             
-            # Go back to results
-            page.go_back()
-            time.sleep(1)
+            # Read the job URL from the card link instead of navigating to it
+            href = card['href']
+            url = urljoin(page_url, href) if href else ""
+            if url and url in self.known_urls:
+                return None
             
             return {
                 'title': title,
@@ -116,10 +532,11 @@ class JobCrawler:
                 'location': location,
                 'url': url,
                 'posted_date': self._get_current_date(),
-                'description': description,
+                'description': "",  # Filled in by _fetch_google_descriptions
                 'metadata': {
                     'source': 'google_careers',
-                    'crawled_at': datetime.now().isoformat()
+                    'crawled_at': self._crawl_timestamp(),
+                    'description_pending': True
                 }
             }
         except Exception as e:
@@ -138,8 +555,15 @@ class JobCrawler:
         Returns:
             List of job dictionaries
         """
-        jobs = []
-        
+        try:
+            return self._run(self._run_with_browser(self.crawl_linkedin_jobs_async, search_terms, max_results, locations))
+        except Exception as e:
+            logger.error(f"Error crawling LinkedIn Jobs: {e}")
+            return []
+    
+    async def crawl_linkedin_jobs_async(self, pages: _PagePool, search_terms: List[str] = None,
+                                        max_results: int = 50, locations: List[str] = None) -> List[Dict]:
+        """Crawl LinkedIn, scraping (term, location) searches concurrently across the page pool."""
         if not search_terms:
             search_terms = ['VP Engineering', 'Director Engineering', 'Engineering Manager']
         
@@ -160,131 +584,166 @@ class JobCrawler:
         logger.info(f"Crawling LinkedIn Jobs for terms: {search_terms}")
         logger.info(f"Target locations: {locations}")
         
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                
-                # Set more realistic headers to avoid detection
-                page.set_extra_http_headers({
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Cache-Control': 'no-cache',
-                    'Pragma': 'no-cache'
-                })
-                
-                for term in search_terms:
-                    for location in locations:
-                        logger.info(f"Searching LinkedIn for: {term} in {location}")
-                        
-                        # Build LinkedIn search URL with location
-                        search_url = f"https://www.linkedin.com/jobs/search/?keywords={term.replace(' ', '%20')}&location={location.replace(' ', '%20')}"
-                        page.goto(search_url)
-                    
-                        # Wait for jobs to load
-                        try:
-                            page.wait_for_selector('.job-search-card', timeout=10000)
-                        except:
-                            logger.warning(f"No jobs found for term: {term} in {location}")
-                            continue
-                        
-                        # Add random delay to avoid detection
-                        time.sleep(2 + (hash(f"{term}{location}") % 3))
-                        
-                        # Scroll to load more jobs
-                        for i in range(2):  # Reduced scrolling to be less aggressive
-                            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                            time.sleep(2)
-                        
-                        # Extract job listings (limit per location to avoid overwhelming)
-                        job_elements = page.query_selector_all('.job-search-card')[:min(max_results//len(locations), 10)]
-                        
-                        for job_elem in job_elements:
-                            try:
-                                job_data = self._extract_linkedin_job(job_elem, location)
-                                if job_data and self._is_text_valid(job_data.get('title', '')):
-                                    jobs.append(job_data)
-                            except Exception as e:
-                                logger.error(f"Error extracting LinkedIn job: {e}")
-                                continue
-                        
-                        time.sleep(self.delay + 1)  # Longer delay between location searches
-                
-                browser.close()
+        # Limit per location to avoid overwhelming
+        per_location = min(max_results // len(locations), 10)
         
-        except Exception as e:
-            logger.error(f"Error crawling LinkedIn Jobs: {e}")
+        results = await asyncio.gather(*[
+            self._scrape_linkedin_search(pages, term, location, per_location)
+            for term in search_terms
+            for location in locations
+        ], return_exceptions=True)
+        jobs = self._flatten_results(results, 'LinkedIn Jobs')
         
         logger.info(f"Found {len(jobs)} jobs from LinkedIn")
         return jobs
     
-    def _extract_linkedin_job(self, job_elem, search_location: str = "") -> Optional[Dict]:
-        """Extract job data from a LinkedIn job element."""
-        try:
-            # Try multiple selectors for better data extraction
-            title_selectors = [
-                '.base-search-card__title',
-                '.base-search-card__title a',
-                '[data-job-title]',
-                '.job-search-card__title'
-            ]
-            
-            company_selectors = [
-                '.base-search-card__subtitle',
-                '.base-search-card__subtitle a',
-                '[data-company-name]',
-                '.job-search-card__subtitle'
-            ]
-            
-            location_selectors = [
-                '.job-search-card__location',
-                '.base-search-card__location',
-                '[data-job-location]'
-            ]
-            
-            # Extract title with fallback selectors
-            title = ""
-            for selector in title_selectors:
-                title_elem = job_elem.query_selector(selector)
-                if title_elem:
-                    title = title_elem.inner_text().strip()
-                    if title and self._is_text_valid(title):
-                        break
-            
-            # Extract company with fallback selectors
-            company = ""
-            for selector in company_selectors:
-                company_elem = job_elem.query_selector(selector)
-                if company_elem:
-                    company = company_elem.inner_text().strip()
-                    if company and self._is_text_valid(company):
-                        break
-            
-            # Extract location with fallback selectors
-            location = search_location  # Use search location as fallback
-            for selector in location_selectors:
-                location_elem = job_elem.query_selector(selector)
-                if location_elem:
-                    extracted_location = location_elem.inner_text().strip()
-                    if extracted_location and self._is_text_valid(extracted_location):
-                        location = extracted_location
-                        break
+    async def _scrape_linkedin_search(self, pages: _PagePool, term: str, location: str,
+                                      max_jobs: int) -> List[Dict]:
+        """Scrape the LinkedIn results for a single term in a single location."""
+        logger.info(f"Searching LinkedIn for: {term} in {location}")
+        
+        # Plain HTTP first; only drive a browser page if the guest API refuses us
+        cards = await self._fetch_linkedin_guest_cards(term, location, max_jobs)
+        if cards is None:
+            cards = await self._scrape_linkedin_cards(pages, term, location, max_jobs)
+        
+        jobs = []
+        for card in cards:
+            try:
+                job_data = self._extract_linkedin_job(card, location)
+                if job_data and self._is_text_valid(job_data.get('title', '')):
+                    jobs.append(job_data)
+            except Exception as e:
+                logger.error(f"Error extracting LinkedIn job: {e}")
+                continue
+        
+        return jobs
+    
+    async def _fetch_linkedin_guest_cards(self, term: str, location: str, max_jobs: int,
+                                          start: int = 0) -> Optional[List[Dict]]:
+        """
+        Fetch result cards from LinkedIn's guest search API without a browser.
+        
+        Returns:
+            Card dictionaries shaped like LINKEDIN_CARDS_JS output, or None if
+            the request was refused or failed and the caller should use Playwright
+        """
+        client = await self._ensure_http()
+        async with self._http_slots:
+            try:
+                response = await client.get(LINKEDIN_GUEST_SEARCH_URL, headers=LINKEDIN_HEADERS, params={
+                    'keywords': term,
+                    'location': location,
+                    'start': start
+                })
+            except httpx.HTTPError as e:
+                logger.warning(f"LinkedIn guest API failed for {term} in {location}: {e}")
+                return None
+            finally:
+                await asyncio.sleep(self._human_delay())
+        
+        if response.status_code != 200:
+            # 403/429 mean we are being rate limited or challenged
+            logger.warning(f"LinkedIn guest API returned {response.status_code} for {term} in {location}")
+            return None
+        
+        from bs4 import BeautifulSoup
+        
+        soup = BeautifulSoup(response.text, 'html.parser')
+        return [self._parse_linkedin_card(card) for card in soup.select('.job-search-card')[:max_jobs]]
+    
+    def _select_texts(self, card, selectors) -> List[str]:
+        """Cleaned text of the first match of each selector in a BeautifulSoup card, '' if none."""
+        elems = [card.select_one(selector) for selector in selectors]
+        return [self._clean_text(elem.get_text(' ')) if elem else "" for elem in elems]
+    
+    def _parse_linkedin_card(self, card) -> Dict:
+        """Read a BeautifulSoup result card into the same shape LINKEDIN_CARDS_JS returns."""
+        link = card.select_one('a[href*="/jobs/view/"]') or card.select_one('a')
+        posted = card.select_one('.job-search-card__listdate')
+        return {
+            'titles': self._select_texts(card, LINKEDIN_TITLE_SELECTORS),
+            'companies': self._select_texts(card, LINKEDIN_COMPANY_SELECTORS),
+            'locations': self._select_texts(card, LINKEDIN_LOCATION_SELECTORS),
+            'href': link.get('href', "") if link else "",
+            'posted': posted.get('datetime') if posted else None
+        }
+    
+    async def _scrape_linkedin_cards(self, pages: _PagePool, term: str, location: str,
+                                     max_jobs: int) -> List[Dict]:
+        """Load a LinkedIn search page in the browser and read its result cards."""
+        cards = []
+        
+        async with self._borrow_page(pages) as page:
+            try:
+                # Set more realistic headers to avoid detection
+                await page.set_extra_http_headers(LINKEDIN_HEADERS)
+                
+                # Build LinkedIn search URL with location
+                search_url = f"https://www.linkedin.com/jobs/search/?keywords={term.replace(' ', '%20')}&location={location.replace(' ', '%20')}"
+                await page.goto(search_url)
+                
+                # Wait for jobs to load
+                try:
+                    await page.wait_for_selector('.job-search-card', timeout=10000)
+                except Exception:
+                    logger.warning(f"No jobs found for term: {term} in {location}")
+                    return cards
+                
+                # Add random delay to avoid detection
+                await asyncio.sleep(self._human_delay())
+                
+                # Scroll to load more jobs
+                await self._scroll_for_more(page, '.job-search-card', 2)  # Reduced scrolling to be less aggressive
+                
+                # Extract job listings
+                cards = await page.eval_on_selector_all('.job-search-card', LINKEDIN_CARDS_JS, {
+                    'max': max_jobs,
+                    'title': LINKEDIN_TITLE_SELECTORS,
+                    'company': LINKEDIN_COMPANY_SELECTORS,
+                    'location': LINKEDIN_LOCATION_SELECTORS
+                })
+                
+                await asyncio.sleep(self._human_delay('careful'))  # Longer delay between location searches
             
-            # Extract URL with better selector
-            link_elem = job_elem.query_selector('a[href*="/jobs/view/"]') or job_elem.query_selector('a')
-            url = link_elem.get_attribute('href') if link_elem else ""
+            except Exception as e:
+                logger.error(f"Error crawling LinkedIn for {term} in {location}: {e}")
+        
+        return cards
+    
+    def _first_valid_text(self, candidates: List[str]) -> str:
+        """Return the first candidate text that passes _is_text_valid, or ''."""
+        for text in candidates:
+            if text and self._is_text_valid(text):
+                return text
+        return ""
+    
+    def _extract_linkedin_job(self, card: Dict, search_location: str = "") -> Optional[Dict]:
+        """Build job data from the fields read off a LinkedIn result card."""
+        try:
+            # Check the URL first so already-known listings are skipped cheaply
+            url = card['href'] or ""
             
             # Clean up URL
             if url and not url.startswith('http'):
                 url = f"https://www.linkedin.com{url}"
             
-            # Extract posted date
-            posted_elem = job_elem.query_selector('.job-search-card__listdate')
-            posted_date = posted_elem.get_attribute('datetime') if posted_elem else self._get_current_date()
+            # Drop per-request refId/trackingId parameters so a listing keeps one URL across crawls
+            if url:
+                url = urlparse(url)._replace(query='', fragment='').geturl()
+            
+            if url and url in self.known_urls:
+                return None
+            
+            # Each field was read with several fallback selectors; take the first valid one
+            title = self._first_valid_text(card['titles'])
+            company = self._first_valid_text(card['companies'])
+            location = self._first_valid_text(card['locations']) or search_location
+            
+            posted_date = card['posted'] or self._get_current_date()
             
             # Skip if critical fields are missing or invalid
-            if not title or not company or not self._is_text_valid(title) or not self._is_text_valid(company):
+            if not title or not company:
                 return None
             
             return {
@@ -292,18 +751,19 @@ class JobCrawler:
                 'company': company,
                 'location': location,
                 'url': url,
-                'posted_date': posted_date or self._get_current_date(),
+                'posted_date': posted_date,
                 'description': "",  # Leave empty for LinkedIn jobs
                 'metadata': {
                     'source': 'linkedin',
                     'search_location': search_location,
-                    'crawled_at': datetime.now().isoformat()
+                    'crawled_at': self._crawl_timestamp()
                 }
             }
         except Exception as e:
             logger.error(f"Error extracting LinkedIn job data: {e}")
             return None
     
+    @_disk_cache("jobs-{date}-{key}.json")
     def crawl_all_sources(self, search_terms: List[str] = None, locations: List[str] = None) -> List[Dict]:
         """
         Crawl all supported job sources.
@@ -348,86 +808,140 @@ class JobCrawler:
         logger.info(f"Starting crawl for terms: {search_terms}")
         logger.info(f"Target locations: {locations}")
         
-        # Crawl Google Careers (still US-focused but may have remote roles)
         try:
-            google_jobs = self.crawl_google_careers(search_terms, max_pages=1)
-            # Filter Google jobs for international companies
-            international_google_jobs = []
-            for job in google_jobs:
-                if any(loc.lower() in job.get('location', '').lower() or 
-                       loc.lower() in job.get('description', '').lower() 
-                       for loc in ['remote', 'international', 'europe', 'israel']):
-                    international_google_jobs.append(job)
-            all_jobs.extend(international_google_jobs)
-            logger.info(f"Found {len(international_google_jobs)} relevant Google jobs")
+            google_jobs, linkedin_jobs = self._run(self._crawl_sources(search_terms, locations))
         except Exception as e:
-            logger.error(f"Failed to crawl Google Careers: {e}")
-        
-        # Crawl LinkedIn Jobs with location targeting
-        try:
-            linkedin_jobs = self.crawl_linkedin_jobs(search_terms, max_results=50, locations=locations)
-            all_jobs.extend(linkedin_jobs)
-        except Exception as e:
-            logger.error(f"Failed to crawl LinkedIn Jobs: {e}")
-        
-        # Remove duplicates based on URL and title+company combination
-        unique_jobs = []
-        seen_urls = set()
-        seen_combinations = set()
-        
+            logger.error(f"Failed to crawl sources: {e}")
+            google_jobs, linkedin_jobs = [], []
+        
+        # Filter Google jobs (still US-focused but may have remote roles) for international companies
+        international_google_jobs = []
+        for job in google_jobs:
+            text = f"{job.get('location', '')} {job.get('description', '')}".lower()
+            if any(keyword in text for keyword in INTERNATIONAL_KEYWORDS):
+                international_google_jobs.append(job)
+        all_jobs.extend(international_google_jobs)
+        logger.info(f"Found {len(international_google_jobs)} relevant Google jobs")
+        
+        all_jobs.extend(linkedin_jobs)
+        
+        # Remove duplicates: keyed by URL, or by title+company for jobs without one
+        unique_by_key = {}
         for job in all_jobs:
-            job_key = f"{job.get('title', '').lower()}_{job.get('company', '').lower()}"
-            url = job.get('url', '')
-            
-            if (url and url not in seen_urls) or (job_key and job_key not in seen_combinations):
-                if url:
-                    seen_urls.add(url)
-                if job_key:
-                    seen_combinations.add(job_key)
-                unique_jobs.append(job)
+            key = job.get('url') or (job.get('title', '').lower(), job.get('company', '').lower())
+            unique_by_key.setdefault(key, job)
+        unique_jobs = list(unique_by_key.values())
         
         logger.info(f"Total unique jobs found: {len(unique_jobs)}")
         return unique_jobs
     
+    async def _crawl_sources(self, search_terms: List[str], locations: List[str]):
+        """Crawl Google Careers and LinkedIn concurrently, sharing one lazily opened page pool."""
+        pages = _PagePool(self._open_pages)
+        try:
+            google_result, linkedin_result = await asyncio.gather(
+                self.crawl_google_careers_async(pages, search_terms, 1),
+                self.crawl_linkedin_jobs_async(pages, search_terms, 50, locations),
+                return_exceptions=True
+            )
+        finally:
+            await pages.close()
+        
+        if isinstance(google_result, Exception):
+            logger.error(f"Failed to crawl Google Careers: {google_result}")
+            google_result = []
+        if isinstance(linkedin_result, Exception):
+            logger.error(f"Failed to crawl LinkedIn Jobs: {linkedin_result}")
+            linkedin_result = []
+        
+        return google_result, linkedin_result
+    
+    def _human_delay(self, profile: Optional[str] = None) -> float:
+        """Draw a pause length in seconds from a DELAY_PROFILES log-normal profile."""
+        mu, sigma, low, high = DELAY_PROFILES.get(profile or self.delay_profile, DELAY_PROFILES['moderate'])
+        return min(max(random.lognormvariate(mu, sigma), low), high)
+    
     def _get_current_date(self) -> str:
-        """Get current date in ISO format."""
-        return datetime.now().date().isoformat()
+        """Get the current crawl run's date in ISO format."""
+        return self._crawl_date or datetime.now().date().isoformat()
+    
+    def _crawl_timestamp(self) -> str:
+        """Get the current crawl run's start time in ISO format."""
+        return self._crawl_ts or datetime.now().isoformat()
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text content."""
         if not text:
             return ""
         
-        # Remove extra whitespace and normalize
-        text = re.sub(r'\s+', ' ', text.strip())
-        return text
+        # Collapse whitespace runs; str.split is a C loop, no regex engine needed
+        return ' '.join(text.split())
     
     def _is_text_valid(self, text: str) -> bool:
         """Check if text appears to be valid (not gibberish or obfuscated)."""
-        if not text or len(text) < 2:
-            return False
-        
-        # Check for too many special characters (common in obfuscated text)
-        special_char_ratio = sum(1 for c in text if not c.isalnum() and not c.isspace()) / len(text)
-        if special_char_ratio > 0.3:
-            return False
-        
-        # Check for too many asterisks (often used for obfuscation)
-        if text.count('*') > len(text) * 0.2:
-            return False
-        
-        # Check for reasonable character distribution
-        alpha_ratio = sum(1 for c in text if c.isalpha()) / len(text)
-        if alpha_ratio < 0.3:  # At least 30% alphabetic characters
-            return False
-        
-        # Check for extremely long words (common in obfuscated text)
-        words = text.split()
-        if any(len(word) > 30 for word in words):
-            return False
-        
-        # Check for repeating patterns (common in gibberish)
-        if len(set(text.lower().replace(' ', ''))) < len(text) * 0.3:
-            return False
-        
-        return True
+        return _text_looks_valid(text)
+
+
+@lru_cache(maxsize=4096)
+def _text_looks_valid(text: str) -> bool:
+    """
+    Validity heuristics behind JobCrawler._is_text_valid.
+    
+    Character classes are counted in one pass: a bytes.translate for ASCII
+    text (most titles and company names), a Counter otherwise. Memoized
+    because the same titles and company names repeat across searches.
+    """
+    if not text or len(text) < 2:
+        return False
+    
+    length = len(text)
+    if text.isascii():
+        classes = text.encode('ascii').translate(ASCII_CLASSES)
+        special = classes.count(b'o')
+        alpha = classes.count(b'a')
+        stars = text.count('*')
+    else:
+        counts = Counter(text)
+        special = sum(n for c, n in counts.items() if not c.isalnum() and not c.isspace())
+        alpha = sum(n for c, n in counts.items() if c.isalpha())
+        stars = counts['*']
+    
+    # Check for too many special characters (common in obfuscated text)
+    if special / length > 0.3:
+        return False
+    
+    # Check for too many asterisks (often used for obfuscation)
+    if stars > length * 0.2:
+        return False
+    
+    # Check for reasonable character distribution
+    if alpha / length < 0.3:  # At least 30% alphabetic characters
+        return False
+    
+    # Check for extremely long words (common in obfuscated text)
+    if LONG_WORD_RE.search(text):
+        return False
+    
+    # Check for repeating patterns (common in gibberish)
+    distinct = set(text.lower())
+    distinct.discard(' ')
+    if len(distinct) < length * 0.3:
+        return False
+    
+    return True
+
+
+def run_crawl(search_terms: List[str] = None, locations: List[str] = None,
+              known_urls: Optional[Set[str]] = None) -> List[Dict]:
+    """
+    Crawl all sources with a fresh JobCrawler.
+    
+    Module-level so it can be submitted to a process pool: the browser,
+    event loop and parsed pages then live in a worker process instead of
+    the caller's, and a long-lived worker reuses its browser_pool browser
+    across crawls.
+    """
+    with JobCrawler() as crawler:
+        if known_urls:
+            crawler.known_urls = known_urls
+        return crawler.crawl_all_sources(search_terms, locations)
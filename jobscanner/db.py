@@ -2,10 +2,33 @@
 
 import sqlite3
 import json
+import queue
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import os
 
+# Columns returned by list endpoints; metadata_json is left out so it never
+# has to be parsed on the read path (source and crawled_at are its hot fields)
+SUMMARY_COLUMNS = "id, title, company, location, url, posted_date, description, status, source, crawled_at"
+
+# Applied to every connection: WAL lets readers run alongside the writer,
+# and NORMAL sync is durable enough for a crawl cache in WAL mode.
+# journal_mode persists in the file; the rest are per connection. busy_timeout
+# makes a second process (daily crawl vs. API) wait for the write lock
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
+
+# Idle read connections kept open between queries; more are opened when all
+# are busy, and the extras are closed on return
+READ_POOL_SIZE = 8
+
 
 class JobDatabase:
     """SQLite database manager for job listings."""
@@ -13,11 +36,100 @@ class JobDatabase:
     def __init__(self, db_path: str = "jobs.db"):
         """Initialize database connection and create tables if needed."""
         self.db_path = db_path
+        # One write connection for the lifetime of the object, shared by the
+        # API's request threads behind _write_lock, with explicit transactions
+        self.conn = self._connect()
+        self._write_lock = threading.RLock()
+        # Reads check out a pooled connection, so concurrent requests run their
+        # queries in parallel and never see a writer's uncommitted rows
+        self._read_pool = queue.LifoQueue(maxsize=READ_POOL_SIZE)
         self.init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open an autocommit connection with CONNECTION_PRAGMAS applied."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def _reading(self):
+        """Check out a pooled read connection for one query, opening one if all are busy."""
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            try:
+                self._read_pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+    
+    def _stream(self, query: str, params) -> Iterator[Dict]:
+        """
+        Yield query rows as dicts, holding a read connection until iteration ends.
+        
+        The query runs immediately, so SQL errors are raised to the caller
+        rather than on first iteration.
+        """
+        rows = self._stream_rows(query, params)
+        next(rows)
+        return rows
+    
+    def _stream_rows(self, query: str, params) -> Iterator[Dict]:
+        """Generator behind _stream; its first next() runs the query."""
+        with self._reading() as conn:
+            cursor = conn.execute(query, params)
+            try:
+                yield
+                for row in cursor:
+                    yield dict(row)
+            finally:
+                # Ends the statement's read snapshot before the connection is reused
+                cursor.close()
+    
+    def _fetchone(self, query: str, params=()) -> Optional[sqlite3.Row]:
+        """Run a read query on a pooled connection and return its first row."""
+        with self._reading() as conn:
+            cursor = conn.execute(query, params)
+            try:
+                return cursor.fetchone()
+            finally:
+                cursor.close()
+    
+    def _fetchall(self, query: str, params=()) -> List[sqlite3.Row]:
+        """Run a read query on a pooled connection and return all its rows."""
+        with self._reading() as conn:
+            return conn.execute(query, params).fetchall()
+    
+    def close(self):
+        """Close the write connection and the idle read connections."""
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+        self.conn.close()
+    
+    @contextmanager
+    def _transaction(self):
+        """Run a block of writes in one transaction, one writer at a time."""
+        with self._write_lock:
+            self.conn.execute("BEGIN")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+    
     def init_database(self):
         """Create the jobs table with the specified schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._write_lock:
+            conn = self.conn
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS jobs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -28,10 +140,79 @@ class JobDatabase:
                     posted_date TEXT,
                     description TEXT,
                     status TEXT DEFAULT 'new',
-                    metadata_json TEXT DEFAULT '{}'
+                    metadata_json TEXT DEFAULT '{}',
+                    source TEXT,
+                    crawled_at TEXT
                 )
             ''')
-            conn.commit()
+            
+            # Databases created before metadata was denormalized: add the typed
+            # columns and backfill them from metadata_json once
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if 'source' not in columns or 'crawled_at' not in columns:
+                for column in ('source', 'crawled_at'):
+                    if column not in columns:
+                        conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} TEXT")
+                conn.execute('''
+                    UPDATE jobs
+                    SET source = json_extract(metadata_json, '$.source'),
+                        crawled_at = json_extract(metadata_json, '$.crawled_at')
+                    WHERE json_valid(metadata_json)
+                ''')
+            
+            # Status listings are read newest first; company serves the per-company
+            # stats GROUP BY (the company filter is a '%x%' LIKE, which no index helps)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_id ON jobs(status, id DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company)")
+            
+            # Trigram index over the searchable columns, kept in sync by triggers;
+            # it answers case-insensitive substring searches like the old scan did
+            fts_sql = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+            ).fetchone()
+            if fts_sql is not None and 'trigram' not in fts_sql[0]:
+                # Built with the default word tokenizer, which can't match inside words
+                conn.execute("DROP TABLE jobs_fts")
+                fts_sql = None
+            conn.executescript('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                    title, company, description, content='jobs', content_rowid='id',
+                    tokenize='trigram'
+                );
+                CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+                    INSERT INTO jobs_fts(rowid, title, company, description)
+                    VALUES (new.id, new.title, new.company, new.description);
+                END;
+                CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+                    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+                    VALUES ('delete', old.id, old.title, old.company, old.description);
+                END;
+                CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE ON jobs BEGIN
+                    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+                    VALUES ('delete', old.id, old.title, old.company, old.description);
+                    INSERT INTO jobs_fts(rowid, title, company, description)
+                    VALUES (new.id, new.title, new.company, new.description);
+                END;
+            ''')
+            if fts_sql is None:
+                # Index rows that were stored before the FTS table existed
+                conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+    
+    @staticmethod
+    def _job_row(job_data: Dict) -> tuple:
+        """Build the INSERT parameters for a job dictionary."""
+        metadata = job_data.get('metadata', {})
+        return (
+            job_data.get('title', ''),
+            job_data.get('company', ''),
+            job_data.get('location', ''),
+            job_data.get('url', ''),
+            job_data.get('posted_date', ''),
+            job_data.get('description', ''),
+            json.dumps(metadata),
+            metadata.get('source'),
+            metadata.get('crawled_at')
+        )
     
     def insert_job(self, job_data: Dict) -> Optional[int]:
         """
@@ -44,86 +225,215 @@ class JobDatabase:
             Job ID if inserted successfully, None if URL already exists
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 cursor = conn.execute('''
-                    INSERT INTO jobs (title, company, location, url, posted_date, description, metadata_json)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    job_data.get('title', ''),
-                    job_data.get('company', ''),
-                    job_data.get('location', ''),
-                    job_data.get('url', ''),
-                    job_data.get('posted_date', ''),
-                    job_data.get('description', ''),
-                    json.dumps(job_data.get('metadata', {}))
-                ))
-                conn.commit()
+                    INSERT INTO jobs (title, company, location, url, posted_date, description,
+                                      metadata_json, source, crawled_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', self._job_row(job_data))
                 return cursor.lastrowid
         except sqlite3.IntegrityError:
             # URL already exists
             return None
     
-    def get_jobs(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+    def insert_jobs_bulk(self, jobs: List[Dict]) -> int:
+        """
+        Insert many job listings in a single transaction.
+        
+        Args:
+            jobs: List of job dictionaries
+        
+        Returns:
+            Number of jobs inserted; jobs whose URL already exists are skipped
+        """
+        if not jobs:
+            return 0
+        
+        with self._transaction() as conn:
+            cursor = conn.executemany('''
+                INSERT INTO jobs (title, company, location, url, posted_date, description,
+                                  metadata_json, source, crawled_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO NOTHING
+            ''', [self._job_row(job) for job in jobs])
+            # rowcount excludes the FTS trigger writes, unlike total_changes
+            return cursor.rowcount
+    
+    @staticmethod
+    def _filter_clause(status: Optional[str], company: Optional[str]) -> Tuple[str, List]:
+        """
+        Build the WHERE clause and parameters for the job list filters.
+        
+        Only filters that are set appear in the SQL, so a status filter can
+        use idx_jobs_status_id (an "? IS NULL OR" guard would force a scan).
+        """
+        clauses = []
+        params = []
+        
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        
+        if company:
+            # LIKE is case-insensitive for ASCII, and any limit applies after it
+            clauses.append("company LIKE ?")
+            params.append(f"%{company}%")
+        
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return where, params
+    
+    def get_jobs(self, status: Optional[str] = None, limit: Optional[int] = None,
+                 company: Optional[str] = None) -> List[Dict]:
         """
         Retrieve jobs from the database.
         
         Args:
             status: Filter by job status (e.g., 'new', 'processed')
             limit: Maximum number of jobs to return
+            company: Case-insensitive substring matched against the company name
         
         Returns:
             List of job dictionaries
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            query = "SELECT * FROM jobs"
-            params = []
-            
-            if status:
-                query += " WHERE status = ?"
-                params.append(status)
-            
-            query += " ORDER BY id DESC"
-            
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
-            
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
-            
-            return [dict(row) for row in rows]
+        return list(self.iter_jobs(status, limit, company))
+    
+    def iter_jobs(self, status: Optional[str] = None, limit: Optional[int] = None,
+                  company: Optional[str] = None) -> Iterator[Dict]:
+        """Like get_jobs, but yield jobs one at a time straight from the cursor."""
+        where, params = self._filter_clause(status, company)
+        query = f"SELECT * FROM jobs{where} ORDER BY id DESC"
+        
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        return self._stream(query, params)
+    
+    def iter_jobs_filtered(self, status: Optional[str] = None, company: Optional[str] = None,
+                           limit: Optional[int] = None, offset: int = 0) -> Iterator[Dict]:
+        """
+        Yield a page of jobs (without metadata_json) straight from the cursor.
+        
+        Args:
+            status: Filter by job status (e.g., 'new', 'processed')
+            company: Case-insensitive substring matched against the company name
+            limit: Maximum number of jobs to return
+            offset: Number of matching jobs to skip
+        
+        The query runs immediately, so SQL errors are raised here rather than
+        on first iteration.
+        """
+        where, params = self._filter_clause(status, company)
+        params += [limit if limit is not None else -1, offset]
+        return self._stream(
+            f"SELECT {SUMMARY_COLUMNS} FROM jobs{where} ORDER BY id DESC LIMIT ? OFFSET ?", params
+        )
+    
+    def count_jobs(self, status: Optional[str] = None, company: Optional[str] = None) -> int:
+        """Count jobs matching the same filters as iter_jobs_filtered."""
+        where, params = self._filter_clause(status, company)
+        return self._fetchone(f"SELECT COUNT(*) FROM jobs{where}", params)[0]
+    
+    def get_job(self, job_id: int) -> Optional[Dict]:
+        """Retrieve a single job by ID, or None if it does not exist."""
+        row = self._fetchone("SELECT * FROM jobs WHERE id = ?", (job_id,))
+        return dict(row) if row else None
+    
+    @staticmethod
+    def _search_source(query: str) -> Tuple[str, List]:
+        """
+        Build the FROM/WHERE SQL matching query as a case-insensitive substring
+        of the title, company or description.
+        
+        Queries of three or more characters are one quoted FTS5 phrase, which
+        the trigram index turns into a substring match. Shorter ones have no
+        trigram to look up, so they scan the table with LIKE.
+        """
+        if len(query) >= 3:
+            phrase = '"' + query.replace('"', '""') + '"'
+            return "jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid WHERE jobs_fts MATCH ?", [phrase]
+        
+        pattern = '%' + query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        where = " OR ".join(f"jobs.{column} LIKE ? ESCAPE '\\'" for column in ('title', 'company', 'description'))
+        return f"jobs WHERE {where}", [pattern] * 3
+    
+    def search_jobs(self, query: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Search job title, company and description for a substring.
+        
+        Args:
+            query: Text to find, matched case-insensitively
+            limit: Maximum number of jobs to return
+        
+        Returns:
+            List of matching job dictionaries (without metadata_json), newest first
+        """
+        query = query.strip()
+        if not query:
+            return []
+        
+        source, params = self._search_source(query)
+        columns = ', '.join(f"jobs.{column}" for column in SUMMARY_COLUMNS.split(', '))
+        rows = self._fetchall(
+            f"SELECT {columns} FROM {source} ORDER BY jobs.id DESC LIMIT ?",
+            params + [limit if limit is not None else -1]
+        )
+        return [dict(row) for row in rows]
+    
+    def count_search_matches(self, query: str) -> int:
+        """Count jobs matching a search_jobs query."""
+        query = query.strip()
+        if not query:
+            return 0
+        
+        source, params = self._search_source(query)
+        return self._fetchone(f"SELECT COUNT(*) FROM {source}", params)[0]
+    
+    def get_company_stats(self) -> List[Dict]:
+        """Get job count and latest posting date per company, busiest first."""
+        rows = self._fetchall('''
+            SELECT company, COUNT(*), MAX(NULLIF(posted_date, ''))
+            FROM jobs
+            GROUP BY company
+            ORDER BY COUNT(*) DESC, MAX(id) DESC
+        ''')
+        return [
+            {'name': row[0], 'job_count': row[1], 'latest_posting': row[2]}
+            for row in rows
+        ]
     
     def update_job_status(self, job_id: int, status: str) -> bool:
         """Update the status of a job."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             cursor = conn.execute(
                 "UPDATE jobs SET status = ? WHERE id = ?",
                 (status, job_id)
             )
-            conn.commit()
-            return cursor.rowcount > 0
+        return cursor.rowcount > 0
     
     def job_exists(self, url: str) -> bool:
         """Check if a job with the given URL already exists."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT 1 FROM jobs WHERE url = ?", (url,))
-            return cursor.fetchone() is not None
+        return self._fetchone("SELECT 1 FROM jobs WHERE url = ?", (url,)) is not None
+    
+    def has_any_jobs(self) -> bool:
+        """Check if the database holds at least one job, without counting them all."""
+        return bool(self._fetchone("SELECT EXISTS(SELECT 1 FROM jobs)")[0])
+    
+    def existing_urls(self) -> Set[str]:
+        """Get the URLs of all stored jobs, for skipping known listings while crawling."""
+        return {row[0] for row in self._fetchall("SELECT url FROM jobs")}
     
     def get_stats(self) -> Dict:
         """Get database statistics."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute('''
-                SELECT 
-                    COUNT(*) as total,
-                    COUNT(CASE WHEN status = 'new' THEN 1 END) as new,
-                    COUNT(CASE WHEN status = 'processed' THEN 1 END) as processed
-                FROM jobs
-            ''')
-            row = cursor.fetchone()
-            return {
-                'total': row[0],
-                'new': row[1],
-                'processed': row[2]
-            }
+        row = self._fetchone('''
+            SELECT 
+                COUNT(*) as total,
+                COUNT(CASE WHEN status = 'new' THEN 1 END) as new,
+                COUNT(CASE WHEN status = 'processed' THEN 1 END) as processed
+            FROM jobs
+        ''')
+        return {
+            'total': row[0],
+            'new': row[1],
+            'processed': row[2]
+        }
@@ -68,22 +68,20 @@ def main():
         print()
     
     # Query jobs
-    jobs = db.get_jobs(status=args.status, limit=args.limit)
-    
-    # Filter by company if specified
-    if args.company:
-        jobs = [job for job in jobs if args.company.lower() in job['company'].lower()]
-    
-    if not jobs:
-        print("❌ No jobs found matching criteria")
-        return
-    
-    print(f"🔍 Found {len(jobs)} jobs:")
-    print("=" * 50)
+    jobs = db.iter_jobs(status=args.status, limit=args.limit, company=args.company)
     
+    shown = 0
     for job in jobs:
+        if shown == 0:
+            print("🔍 Matching jobs:")
+            print("=" * 50)
         display_job(job, detailed=args.detailed)
-
+        shown += 1
+    
+    if shown == 0:
+        print("❌ No jobs found matching criteria")
+    else:
+        print(f"🔍 Found {shown} jobs")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -8,6 +8,7 @@ Designed to be run as a scheduled job (e.g., via GitHub Actions, cron, etc.)
 
 import sys
 import os
+import argparse
 from datetime import datetime
 import logging
 
@@ -31,6 +32,11 @@ logger = logging.getLogger(__name__)
 
 def main():
     """Main function to run the daily job crawling process."""
+    parser = argparse.ArgumentParser(description='Run the JobScanner daily crawl')
+    parser.add_argument('--refresh-cache', action='store_true',
+                        help="Crawl again even if today's results are already cached in .cache/")
+    args = parser.parse_args()
+    
     logger.info("🚀 Starting JobScanner daily crawl")
     
     try:
@@ -45,6 +51,12 @@ def main():
         # Initialize crawler
         logger.info("🕸️  Initializing crawler...")
         crawler = JobCrawler()
+        crawler.cache_dir = ".cache"  # Re-runs on the same day reuse today's results
+        crawler.refresh_cache = args.refresh_cache
+        
+        # Skip listings we already have before paying for their detail pages
+        crawler.known_urls = db.existing_urls()
+        logger.info(f"⏭️  Skipping {len(crawler.known_urls)} already known job URLs")
         
         # Define search terms for senior engineering roles
         search_terms = [
@@ -78,7 +90,8 @@ def main():
         
         # Crawl all sources
         logger.info(f"🔍 Starting crawl for {len(search_terms)} search terms in {len(locations)} locations...")
-        jobs = crawler.crawl_all_sources(search_terms, locations)
+        with crawler:
+            jobs = crawler.crawl_all_sources(search_terms, locations)
         
         if not jobs:
             logger.warning("⚠️  No jobs found during crawl")
@@ -86,20 +99,8 @@ def main():
         
         # Save jobs to database
         logger.info(f"💾 Saving {len(jobs)} jobs to database...")
-        new_jobs_count = 0
-        duplicate_count = 0
-        
-        for job in jobs:
-            try:
-                job_id = db.insert_job(job)
-                if job_id:
-                    new_jobs_count += 1
-                    logger.debug(f"✅ Saved job: {job['title']} at {job['company']}")
-                else:
-                    duplicate_count += 1
-                    logger.debug(f"⏭️  Skipped duplicate: {job['title']} at {job['company']}")
-            except Exception as e:
-                logger.error(f"❌ Error saving job {job.get('title', 'Unknown')}: {e}")
+        new_jobs_count = db.insert_jobs_bulk(jobs)
+        duplicate_count = len(jobs) - new_jobs_count
         
         # Get final stats
         final_stats = db.get_stats()
@@ -123,6 +124,9 @@ def main():
             for job in recent_jobs:
                 logger.info(f"  • {job['title']} @ {job['company']} ({job['location']})")
         
+        # Closing checkpoints the WAL back into jobs.db before the workflow copies it
+        db.close()
+        
         logger.info("✅ JobScanner daily crawl completed successfully!")
         
     except Exception as e:
@@ -8,19 +8,24 @@ Installs required dependencies and sets up the environment.
 import subprocess
 import sys
 import os
+import tempfile
 
 
 def run_command(command, description):
-    """Run a command and handle errors."""
+    """Run a command (argument list, no shell) and handle errors."""
     print(f"🔧 {description}...")
     try:
-        result = subprocess.run(command, check=True, shell=True, capture_output=True, text=True)
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
         print(f"✅ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed:")
         print(f"   Error: {e.stderr}")
         return False
+    except OSError as e:
+        print(f"❌ {description} failed:")
+        print(f"   Error: {e}")
+        return False
 
 
 def main():
@@ -36,7 +41,9 @@ def main():
     print(f"✅ Python {sys.version.split()[0]} detected")
     
     # Install Python dependencies
-    if not run_command("pip install -r requirements.txt", "Installing Python dependencies"):
+    # Run pip and playwright through this interpreter so they target the same environment
+    if not run_command([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
+                       "Installing Python dependencies"):
         print("💡 Tip: You might want to use a virtual environment:")
         print("   python -m venv venv")
         print("   source venv/bin/activate  # On Windows: venv\\Scripts\\activate")
@@ -44,7 +51,8 @@ def main():
         sys.exit(1)
     
     # Install Playwright browsers
-    if not run_command("playwright install chromium", "Installing Playwright Chromium browser"):
+    if not run_command([sys.executable, "-m", "playwright", "install", "chromium"],
+                       "Installing Playwright Chromium browser"):
         print("❌ Failed to install Playwright browsers")
         print("💡 Try running manually: playwright install chromium")
         sys.exit(1)
@@ -59,14 +67,15 @@ def main():
         sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
         from jobscanner.db import JobDatabase
         
-        db = JobDatabase("test_jobs.db")
-        stats = db.get_stats()
+        # Throwaway DB (plus its WAL/SHM files) is removed with the directory
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db = JobDatabase(os.path.join(temp_dir, "test_jobs.db"))
+            try:
+                stats = db.get_stats()
+            finally:
+                db.close()
         print(f"✅ Database initialized successfully (stats: {stats})")
         
-        # Clean up test database
-        if os.path.exists("test_jobs.db"):
-            os.remove("test_jobs.db")
-        
     except Exception as e:
         print(f"❌ Database test failed: {e}")
         sys.exit(1)
@@ -41,19 +41,24 @@ def main():
             all_jobs = crawler.crawl_all_sources(test_terms, test_locations)
             logger.info(f"✅ Location-targeted crawl: Found {len(all_jobs)} jobs")
             
-            # Show sample jobs if found
+            # Show sample jobs if found, in one log record
             if all_jobs:
-                for i, job in enumerate(all_jobs[:3]):  # Show first 3 jobs
-                    if crawler._is_text_valid(job.get('title', '')) and crawler._is_text_valid(job.get('company', '')):
-                        logger.info(f"📋 Sample job {i+1}: {job['title']} @ {job['company']} ({job.get('location', 'Unknown')})")
-                        
-                        # Test database insertion for first job
-                        if i == 0:
-                            job_id = db.insert_job(job)
-                            if job_id:
-                                logger.info(f"✅ Database test: Saved job with ID {job_id}")
-                            else:
-                                logger.info("ℹ️  Database test: Job already exists (duplicate)")
+                sample_lines = [
+                    f"  {i+1}: {job['title']} @ {job['company']} ({job.get('location', 'Unknown')})"
+                    for i, job in enumerate(all_jobs[:3])  # Show first 3 jobs
+                    if crawler._is_text_valid(job.get('title', '')) and crawler._is_text_valid(job.get('company', ''))
+                ]
+                if sample_lines:
+                    logger.info("📋 Sample jobs:\n" + "\n".join(sample_lines))
+                
+                # Test database insertion for first job
+                first_job = all_jobs[0]
+                if crawler._is_text_valid(first_job.get('title', '')) and crawler._is_text_valid(first_job.get('company', '')):
+                    job_id = db.insert_job(first_job)
+                    if job_id:
+                        logger.info(f"✅ Database test: Saved job with ID {job_id}")
+                    else:
+                        logger.info("ℹ️  Database test: Job already exists (duplicate)")
         
         except Exception as e:
             logger.error(f"❌ Location-targeted crawl test failed: {e}")
@@ -64,14 +69,20 @@ def main():
             linkedin_jobs = crawler.crawl_linkedin_jobs(test_terms, max_results=3, locations=['Israel'])
             logger.info(f"✅ LinkedIn Israel test: Found {len(linkedin_jobs)} jobs")
             
-            if linkedin_jobs:
-                for job in linkedin_jobs:
-                    if crawler._is_text_valid(job.get('title', '')) and crawler._is_text_valid(job.get('company', '')):
-                        logger.info(f"📋 LinkedIn job: {job['title']} @ {job['company']} ({job.get('location', 'Unknown')})")
+            linkedin_lines = [
+                f"  {job['title']} @ {job['company']} ({job.get('location', 'Unknown')})"
+                for job in linkedin_jobs
+                if crawler._is_text_valid(job.get('title', '')) and crawler._is_text_valid(job.get('company', ''))
+            ]
+            if linkedin_lines:
+                logger.info("📋 LinkedIn jobs:\n" + "\n".join(linkedin_lines))
         
         except Exception as e:
             logger.error(f"❌ LinkedIn direct test failed: {e}")
         
+        # Both tests above reused the same shared browser
+        crawler.close()
+        
         # Final database stats
         stats = db.get_stats()
         logger.info(f"📊 Final database stats: {stats}")
@@ -3,15 +3,15 @@
 JobScanner Startup Script
 
 This script:
-1. Runs an initial crawl to populate the database (if empty)
+1. Runs an initial crawl to populate the database (if empty), in the
+   background unless INITIAL_CRAWL_BLOCKING=1
 2. Starts the Flask API server
 """
 
 import os
 import sys
 import logging
-from jobscanner.db import JobDatabase
-from jobscanner.crawler import JobCrawler
+import threading
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -19,19 +19,17 @@ logger = logging.getLogger(__name__)
 
 def check_and_populate_database():
     """Check if database has data, run initial crawl if empty"""
+    # The API's own database and crawl path: the crawl runs in its worker
+    # process and updates crawl status and the response caches like /api/crawl
+    from app import db, run_crawl_async
+    
     try:
-        db = JobDatabase("jobs.db")
-        stats = db.get_stats()
-        
-        logger.info(f"Database stats: {stats}")
-        
-        if stats['total'] == 0:
+        if not db.has_any_jobs():
             logger.info("Database is empty, running initial crawl...")
             
             # Run a limited initial crawl with location targeting
-            crawler = JobCrawler()
-            jobs = crawler.crawl_all_sources(
-                search_terms=[
+            run_crawl_async(
+                [
                     'Staff Engineer', 
                     'VP Engineering', 
                     'Director Engineering'
@@ -44,16 +42,9 @@ def check_and_populate_database():
                 ]
             )
             
-            # Save jobs to database
-            new_jobs = 0
-            for job in jobs:
-                job_id = db.insert_job(job)
-                if job_id:
-                    new_jobs += 1
-            
-            logger.info(f"Initial crawl completed: {new_jobs} new jobs added")
-            
         else:
+            stats = db.get_stats()
+            logger.info(f"Database stats: {stats}")
             logger.info(f"Database already has {stats['total']} jobs, skipping initial crawl")
             
     except Exception as e:
@@ -64,8 +55,13 @@ def main():
     """Main startup function"""
     logger.info("🚀 Starting JobScanner API Backend...")
     
-    # Check and populate database if needed
-    check_and_populate_database()
+    # Check and populate database if needed. By default this runs in the
+    # background so the API binds its port (and answers /health) right away;
+    # INITIAL_CRAWL_BLOCKING=1 waits for it before serving instead
+    if os.environ.get('INITIAL_CRAWL_BLOCKING') == '1':
+        check_and_populate_database()
+    else:
+        threading.Thread(target=check_and_populate_database, daemon=True).start()
     
     # Import and start the Flask app
     from app import app
@@ -2,169 +2,118 @@
 """
 JobScanner API Testing Script
 
-Test the API endpoints to make sure everything works.
+Test the API endpoints to make sure everything works. The tests run under
+pytest against a live server (pip install -r requirements-dev.txt);
+fixtures and options are in conftest.py:
+
+    pytest -n 5 -rA test_api.py --api-url https://your-app.example.com
+    pytest -n 5 -rA test_api.py --test-crawl    # also trigger a manual crawl
+
+-n runs the tests in parallel (pytest-xdist), and -rA reports the stats and
+sample jobs each test prints. The old command line does both:
+python test_api.py [URL] [--test-crawl]
 """
 
-import requests
-import json
 import sys
 import time
 
-def test_api(base_url="http://localhost:5000"):
-    """Test all API endpoints"""
-    
-    print(f"🧪 Testing JobScanner API at: {base_url}")
-    print("=" * 50)
-    
-    tests = []
-    
-    # Test 1: Health check
-    print("1. Testing health endpoint...")
-    try:
-        response = requests.get(f"{base_url}/health", timeout=10)
-        if response.status_code == 200:
-            print("   ✅ Health check passed")
-            tests.append(True)
-        else:
-            print(f"   ❌ Health check failed: {response.status_code}")
-            tests.append(False)
-    except Exception as e:
-        print(f"   ❌ Health check error: {e}")
-        tests.append(False)
-    
-    # Test 2: Stats endpoint
-    print("2. Testing stats endpoint...")
-    try:
-        response = requests.get(f"{base_url}/api/stats", timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            stats = data.get('data', {})
-            print(f"   ✅ Stats: {stats}")
-            tests.append(True)
-        else:
-            print(f"   ❌ Stats failed: {response.status_code}")
-            tests.append(False)
-    except Exception as e:
-        print(f"   ❌ Stats error: {e}")
-        tests.append(False)
-    
-    # Test 3: Jobs endpoint
-    print("3. Testing jobs endpoint...")
-    try:
-        response = requests.get(f"{base_url}/api/jobs?limit=5", timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            jobs = data.get('data', {}).get('jobs', [])
-            print(f"   ✅ Found {len(jobs)} jobs")
-            if jobs:
-                print(f"   📋 Sample job: {jobs[0]['title']} @ {jobs[0]['company']}")
-            tests.append(True)
-        else:
-            print(f"   ❌ Jobs failed: {response.status_code}")
-            tests.append(False)
-    except Exception as e:
-        print(f"   ❌ Jobs error: {e}")
-        tests.append(False)
-    
-    # Test 4: Companies endpoint
-    print("4. Testing companies endpoint...")
-    try:
-        response = requests.get(f"{base_url}/api/companies", timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            companies = data.get('data', [])
-            print(f"   ✅ Found {len(companies)} companies")
-            if companies:
-                print(f"   🏢 Top company: {companies[0]['name']} ({companies[0]['job_count']} jobs)")
-            tests.append(True)
-        else:
-            print(f"   ❌ Companies failed: {response.status_code}")
-            tests.append(False)
-    except Exception as e:
-        print(f"   ❌ Companies error: {e}")
-        tests.append(False)
-    
-    # Test 5: Crawl status endpoint
-    print("5. Testing crawl status endpoint...")
-    try:
-        response = requests.get(f"{base_url}/api/crawl/status", timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            status = data.get('data', {})
-            print(f"   ✅ Crawl status: {status}")
-            tests.append(True)
-        else:
-            print(f"   ❌ Crawl status failed: {response.status_code}")
-            tests.append(False)
-    except Exception as e:
-        print(f"   ❌ Crawl status error: {e}")
-        tests.append(False)
-    
-    # Test 6: Manual crawl trigger (optional)
-    if "--test-crawl" in sys.argv:
-        print("6. Testing manual crawl trigger...")
-        try:
-            response = requests.post(
-                f"{base_url}/api/crawl", 
-                json={"search_terms": ["Test Engineer"]},
-                timeout=10
-            )
-            if response.status_code == 200:
-                print("   ✅ Crawl triggered successfully")
-                
-                # Wait and check status
-                print("   ⏳ Waiting 30 seconds to check progress...")
-                time.sleep(30)
-                
-                status_response = requests.get(f"{base_url}/api/crawl/status", timeout=10)
-                if status_response.status_code == 200:
-                    status_data = status_response.json()
-                    crawl_status = status_data.get('data', {})
-                    if crawl_status.get('is_running'):
-                        print("   🔄 Crawl still running...")
-                    else:
-                        results = crawl_status.get('last_results', {})
-                        print(f"   ✅ Crawl completed: {results}")
-                
-                tests.append(True)
-            else:
-                print(f"   ❌ Crawl trigger failed: {response.status_code}")
-                tests.append(False)
-        except Exception as e:
-            print(f"   ❌ Crawl trigger error: {e}")
-            tests.append(False)
-    
-    # Summary
-    print("\n" + "=" * 50)
-    print("📊 TEST SUMMARY")
-    print("=" * 50)
-    
-    passed = sum(tests)
-    total = len(tests)
-    
-    print(f"✅ Passed: {passed}/{total}")
-    if passed == total:
-        print("🎉 All tests passed! API is working correctly.")
-        return True
-    else:
-        print("❌ Some tests failed. Check the API deployment.")
-        return False
+import pytest
+
+
+def test_health(api_session, api_url):
+    """Health endpoint answers."""
+    response = api_session.get(f"{api_url}/health", timeout=10)
+    assert response.status_code == 200, f"Health check failed: {response.status_code}"
+
+
+def test_stats(api_session, api_url):
+    """Stats endpoint returns job counts."""
+    response = api_session.get(f"{api_url}/api/stats", timeout=10)
+    assert response.status_code == 200, f"Stats failed: {response.status_code}"
+
+    stats = response.json().get('data', {})
+    assert 'total' in stats
+    print(f"Stats: {stats}")
+
+
+def test_jobs(api_session, api_url):
+    """Jobs endpoint returns a page of jobs."""
+    response = api_session.get(f"{api_url}/api/jobs?limit=5", timeout=10)
+    assert response.status_code == 200, f"Jobs failed: {response.status_code}"
+
+    jobs = response.json().get('data', {}).get('jobs', [])
+    assert len(jobs) <= 5
+    print(f"Found {len(jobs)} jobs")
+    if jobs:
+        print(f"Sample job: {jobs[0]['title']} @ {jobs[0]['company']}")
+
+
+def test_companies(api_session, api_url):
+    """Companies endpoint returns per-company job counts."""
+    response = api_session.get(f"{api_url}/api/companies", timeout=10)
+    assert response.status_code == 200, f"Companies failed: {response.status_code}"
+
+    companies = response.json().get('data', [])
+    print(f"Found {len(companies)} companies")
+    if companies:
+        print(f"Top company: {companies[0]['name']} ({companies[0]['job_count']} jobs)")
+
+
+def test_crawl_status(api_session, api_url):
+    """Crawl status endpoint reports whether a crawl is running."""
+    response = api_session.get(f"{api_url}/api/crawl/status", timeout=10)
+    assert response.status_code == 200, f"Crawl status failed: {response.status_code}"
+
+    status = response.json().get('data', {})
+    assert 'is_running' in status
+    print(f"Crawl status: {status}")
+
+
+def test_manual_crawl(api_session, api_url, pytestconfig):
+    """Manual crawl can be triggered; waits up to 2 minutes for it to finish."""
+    if not pytestconfig.getoption("--test-crawl"):
+        pytest.skip("use --test-crawl to include crawl testing")
+
+    response = api_session.post(
+        f"{api_url}/api/crawl",
+        json={"search_terms": ["Test Engineer"]},
+        timeout=10
+    )
+    assert response.status_code == 200, f"Crawl trigger failed: {response.status_code}"
+
+    # Poll status with backoff until the crawl finishes (up to 2 minutes)
+    deadline = time.monotonic() + 120
+    delay = 0.5
+    crawl_status = {}
+    while time.monotonic() < deadline:
+        time.sleep(delay)
+        delay = min(delay * 1.5, 5.0)
+        status_response = api_session.get(f"{api_url}/api/crawl/status", timeout=10)
+        if status_response.status_code == 200:
+            crawl_status = status_response.json().get('data', {})
+            if crawl_status.get('is_running') is False:
+                break
+
+    assert crawl_status.get('is_running') is False, "Crawl did not finish within 2 minutes"
+    assert crawl_status.get('error') is None, f"Crawl failed: {crawl_status['error']}"
+    print(f"Crawl completed: {crawl_status.get('last_results', {})}")
+
 
 def main():
-    """Main function"""
+    """Run the tests with pytest, keeping the old command line"""
     base_url = "http://localhost:5000"
-    
+
     # Check for custom URL
     if len(sys.argv) > 1 and not sys.argv[1].startswith("--"):
         base_url = sys.argv[1]
-    
-    print(f"JobScanner API Test Suite")
-    print(f"Target URL: {base_url}")
-    print(f"Use --test-crawl to include crawl testing")
-    print()
-    
-    success = test_api(base_url)
-    sys.exit(0 if success else 1)
+
+    # Endpoint checks are independent, so run them in parallel worker processes;
+    # -rA shows what each test printed, which pytest captures otherwise
+    args = [__file__, "-v", "-rA", "-n", "5", "--api-url", base_url]
+    if "--test-crawl" in sys.argv:
+        args.append("--test-crawl")
+
+    sys.exit(pytest.main(args))
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
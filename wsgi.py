@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+JobScanner WSGI Entry Point
+
+Serves the Flask API through a production WSGI server instead of the
+Flask development server:
+
+    gunicorn -k gthread -w 1 --threads 8 -b 0.0.0.0:$PORT wsgi:app
+
+A single worker keeps crawl status and response caches in one process,
+while its threads let concurrent requests overlap their SQLite reads.
+"""
+
+from app import app